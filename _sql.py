@@ -0,0 +1,28 @@
+"""
+SQL shared by track.py, check_rbac_status.py and test_rbac.py
+Keeping one copy of each string means both scripts issue identical statements
+"""
+
+# Connection setup: WAL so the scripts can read while the app is writing
+SQL_WAL_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-20000;"
+    "PRAGMA busy_timeout=5000;"
+)
+
+SQL_RECENT_SESSIONS = """
+    SELECT u.username, s.login_time, s.logout_time, s.session_duration
+    FROM user_sessions s
+    JOIN users u ON s.user_id = u.id
+    ORDER BY s.login_time DESC
+    LIMIT 5
+"""
+
+SQL_RECENT_REPORTS = """
+    SELECT username, report_type, location, generation_date
+    FROM generated_reports
+    ORDER BY generation_date DESC
+    LIMIT 5
+"""
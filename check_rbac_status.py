@@ -1,127 +1,144 @@
-"""
-Quick script to check RBAC status and recent activity
-Run this after testing the application to see the results
-"""
-import sqlite3
-from datetime import datetime
-
-DATABASE_NAME = 'ZRP_CrimeData.db'
-
-def check_status():
-    print("\n" + "="*70)
-    print("  ZRP RBAC SYSTEM - CURRENT STATUS")
-    print("="*70)
-    
-    try:
-        conn = sqlite3.connect(DATABASE_NAME)
-        cursor = conn.cursor()
-        
-        # 1. User Status
-        print("\n📊 USER STATUS:")
-        cursor.execute("""
-            SELECT username, role, daily_prediction_count, last_prediction_date, last_login
-            FROM users
-            ORDER BY role, username
-        """)
-        users = cursor.fetchall()
-        for user in users:
-            print(f"  • {user[0]:10} ({user[1]:15}) | Predictions: {user[2] or 0:2} | Last: {user[3] or 'Never':10} | Login: {user[4] or 'Never'}")
-        
-        # 2. Recent Audit Logs
-        print("\n📝 RECENT AUDIT LOGS (Last 10):")
-        cursor.execute("""
-            SELECT timestamp, username, action, details
-            FROM audit_logs
-            ORDER BY timestamp DESC
-            LIMIT 10
-        """)
-        logs = cursor.fetchall()
-        if logs:
-            for log in logs:
-                print(f"  • {log[0]} | {log[1]:10} | {log[2]:20} | {log[3] or ''}")
-        else:
-            print("  (No audit logs yet)")
-        
-        # 3. Active Sessions
-        print("\n🔐 ACTIVE SESSIONS:")
-        cursor.execute("""
-            SELECT u.username, s.login_time, s.id
-            FROM user_sessions s
-            JOIN users u ON s.user_id = u.id
-            WHERE s.logout_time IS NULL
-            ORDER BY s.login_time DESC
-        """)
-        active = cursor.fetchall()
-        if active:
-            for sess in active:
-                print(f"  • {sess[0]:10} | Logged in at: {sess[1]} | Session ID: {sess[2]}")
-        else:
-            print("  (No active sessions)")
-        
-        # 4. Recent Sessions
-        print("\n📅 RECENT SESSIONS (Last 5):")
-        cursor.execute("""
-            SELECT u.username, s.login_time, s.logout_time, s.session_duration
-            FROM user_sessions s
-            JOIN users u ON s.user_id = u.id
-            ORDER BY s.login_time DESC
-            LIMIT 5
-        """)
-        sessions = cursor.fetchall()
-        if sessions:
-            for sess in sessions:
-                duration = f"{sess[3]} min" if sess[3] else "Active"
-                logout = sess[2] if sess[2] else "Still active"
-                print(f"  • {sess[0]:10} | In: {sess[1]} | Out: {logout} | Duration: {duration}")
-        else:
-            print("  (No sessions yet)")
-        
-        # 5. Prediction History
-        print("\n🎯 PREDICTION HISTORY (Last 5):")
-        cursor.execute("""
-            SELECT username, location, predicted_crimes, timestamp
-            FROM prediction_history
-            ORDER BY timestamp DESC
-            LIMIT 5
-        """)
-        predictions = cursor.fetchall()
-        if predictions:
-            for pred in predictions:
-                crimes = pred[2][:50] + "..." if len(pred[2]) > 50 else pred[2]
-                print(f"  • {pred[3]} | {pred[0]:10} | {pred[1]:15} | {crimes}")
-        else:
-            print("  (No predictions yet)")
-        
-        # 6. Generated Reports
-        print("\n📄 GENERATED REPORTS (Last 5):")
-        cursor.execute("""
-            SELECT username, report_type, location, generation_date
-            FROM generated_reports
-            ORDER BY generation_date DESC
-            LIMIT 5
-        """)
-        reports = cursor.fetchall()
-        if reports:
-            for rep in reports:
-                print(f"  • {rep[3]} | {rep[0]:10} | {rep[1]:30} | {rep[2]}")
-        else:
-            print("  (No reports generated yet)")
-        
-        # 7. System Settings
-        print("\n⚙️  SYSTEM SETTINGS:")
-        cursor.execute("SELECT setting_key, setting_value FROM system_settings")
-        settings = cursor.fetchall()
-        for setting in settings:
-            print(f"  • {setting[0]:30} = {setting[1]}")
-        
-        print("\n" + "="*70)
-        print("  Status check complete!")
-        print("="*70 + "\n")
-        
-        conn.close()
-        
-    except Exception as e:
-        print(f"\n❌ ERROR: {e}")
-
-if __name__ == '__main__':
-    check_status()
+"""
+Quick script to check RBAC status and recent activity
+Run this after testing the application to see the results
+"""
+import sqlite3
+import sys
+from datetime import datetime
+
+from _sql import SQL_RECENT_REPORTS, SQL_RECENT_SESSIONS, SQL_WAL_PRAGMAS
+
+DATABASE_NAME = 'ZRP_CrimeData.db'
+
+# Status queries (the ones test_rbac.py also runs live in _sql.py)
+SQL_USER_STATUS = """
+    SELECT username, role,
+           COALESCE(daily_prediction_count, 0) AS daily_prediction_count,
+           COALESCE(last_prediction_date, 'Never') AS last_prediction_date,
+           COALESCE(last_login, 'Never') AS last_login
+    FROM users
+    ORDER BY role, username
+"""
+
+SQL_RECENT_AUDIT = """
+    SELECT timestamp, username, action, details
+    FROM audit_logs
+    ORDER BY timestamp DESC
+    LIMIT 10
+"""
+
+SQL_ACTIVE_SESSIONS = """
+    SELECT u.username, s.login_time, s.id
+    FROM user_sessions s
+    JOIN users u ON s.user_id = u.id
+    WHERE s.logout_time IS NULL
+    ORDER BY s.login_time DESC
+"""
+
+SQL_RECENT_PREDICTIONS = """
+    SELECT username, location,
+           CASE WHEN length(crimes) > 50
+                THEN substr(crimes, 1, 50) || '...'
+                ELSE crimes END AS predicted_crimes,
+           timestamp
+    FROM (
+        -- predicted_crimes is a JSON array; rows the app hasn't migrated yet are plain text
+        SELECT username, location, timestamp,
+               CASE WHEN json_valid(predicted_crimes)
+                    THEN (SELECT group_concat(value, ', ') FROM json_each(predicted_crimes))
+                    ELSE predicted_crimes END AS crimes
+        FROM prediction_history
+        ORDER BY timestamp DESC
+        LIMIT 5
+    )
+    ORDER BY timestamp DESC
+"""
+
+SQL_SYSTEM_SETTINGS = "SELECT setting_key, setting_value FROM system_settings"
+
+def _open_db():
+    """Open the database in WAL mode so reads don't block the running app"""
+    conn = sqlite3.connect(DATABASE_NAME)
+    conn.executescript(SQL_WAL_PRAGMAS)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def check_status():
+    print("\n" + "="*70)
+    print("  ZRP RBAC SYSTEM - CURRENT STATUS")
+    print("="*70)
+    
+    try:
+        conn = _open_db()
+        
+        # Read everything from one snapshot; the lock is taken on the first SELECT
+        conn.isolation_level = None
+        conn.execute("BEGIN DEFERRED")
+        
+        # 1. User Status
+        print("\n📊 USER STATUS:")
+        users = conn.execute(SQL_USER_STATUS).fetchall()
+        sys.stdout.write("".join(f"  • {user['username']:10} ({user['role']:15}) | Predictions: {user['daily_prediction_count']:2} | Last: {user['last_prediction_date']:10} | Login: {user['last_login']}\n" for user in users))
+        
+        # 2. Recent Audit Logs
+        print("\n📝 RECENT AUDIT LOGS (Last 10):")
+        logs = conn.execute(SQL_RECENT_AUDIT).fetchall()
+        if logs:
+            sys.stdout.write("".join(f"  • {log['timestamp']} | {log['username']:10} | {log['action']:20} | {log['details'] or ''}\n" for log in logs))
+        else:
+            print("  (No audit logs yet)")
+        
+        # 3. Active Sessions
+        print("\n🔐 ACTIVE SESSIONS:")
+        active = conn.execute(SQL_ACTIVE_SESSIONS).fetchall()
+        if active:
+            sys.stdout.write("".join(f"  • {sess['username']:10} | Logged in at: {sess['login_time']} | Session ID: {sess['id']}\n" for sess in active))
+        else:
+            print("  (No active sessions)")
+        
+        # 4. Recent Sessions
+        print("\n📅 RECENT SESSIONS (Last 5):")
+        sessions = conn.execute(SQL_RECENT_SESSIONS).fetchall()
+        if sessions:
+            lines = []
+            for sess in sessions:
+                duration = f"{sess['session_duration']} min" if sess['session_duration'] else "Active"
+                logout = sess['logout_time'] if sess['logout_time'] else "Still active"
+                lines.append(f"  • {sess['username']:10} | In: {sess['login_time']} | Out: {logout} | Duration: {duration}\n")
+            sys.stdout.write("".join(lines))
+        else:
+            print("  (No sessions yet)")
+        
+        # 5. Prediction History
+        print("\n🎯 PREDICTION HISTORY (Last 5):")
+        predictions = conn.execute(SQL_RECENT_PREDICTIONS).fetchall()
+        if predictions:
+            sys.stdout.write("".join(f"  • {pred['timestamp']} | {pred['username']:10} | {pred['location']:15} | {pred['predicted_crimes']}\n" for pred in predictions))
+        else:
+            print("  (No predictions yet)")
+        
+        # 6. Generated Reports
+        print("\n📄 GENERATED REPORTS (Last 5):")
+        reports = conn.execute(SQL_RECENT_REPORTS).fetchall()
+        if reports:
+            sys.stdout.write("".join(f"  • {rep['generation_date']} | {rep['username']:10} | {rep['report_type']:30} | {rep['location']}\n" for rep in reports))
+        else:
+            print("  (No reports generated yet)")
+        
+        # 7. System Settings
+        print("\n⚙️  SYSTEM SETTINGS:")
+        settings = conn.execute(SQL_SYSTEM_SETTINGS).fetchall()
+        sys.stdout.write("".join(f"  • {setting['setting_key']:30} = {setting['setting_value']}\n" for setting in settings))
+        
+        print("\n" + "="*70)
+        print("  Status check complete!")
+        print("="*70 + "\n")
+        
+        conn.execute("ROLLBACK")
+        conn.close()
+        
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+
+if __name__ == '__main__':
+    check_status()